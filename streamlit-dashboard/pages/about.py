@@ -8,14 +8,15 @@ import sys
 from pathlib import Path
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from utils.config import AppConfig
+from utils.config import AppConfig, get_config
 
 def render_page():
     """Render the about page"""
-    config = AppConfig()
+    config = get_config()
     
     st.title("ℹ️ About Analytics Dashboard")
     st.markdown("Learn more about this comprehensive data analytics platform")
@@ -350,7 +351,7 @@ def render_support_section():
     st.markdown("---")
     st.markdown(
         "<p style='text-align: center; color: #666; font-style: italic;'>"
-        f"Analytics Dashboard v{AppConfig().VERSION} - Built with ❤️ using Streamlit"
+        f"Analytics Dashboard v{get_config().VERSION} - Built with ❤️ using Streamlit"
         "</p>", 
         unsafe_allow_html=True
     )
\ No newline at end of file
@@ -14,14 +14,15 @@ import sys
 from pathlib import Path
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from utils.theme_manager import ThemeManager
+from utils.theme_manager import ThemeManager, get_theme_manager
 
 def render_page(sample_data: dict, uploaded_data: pd.DataFrame = None):
     """Render the main dashboard page"""
-    theme_manager = ThemeManager()
+    theme_manager = get_theme_manager()
     
     st.title("📊 Analytics Dashboard")
     st.markdown("Welcome to your comprehensive analytics overview")
@@ -66,48 +67,22 @@ def render_key_metrics(data: pd.DataFrame, theme_manager: ThemeManager):
     prev_aov = avg_order_value * 0.88
     prev_profit = total_profit * 0.83
     
-    # Create metric columns
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        revenue_delta = ((total_revenue - prev_revenue) / prev_revenue * 100)
-        revenue_card = theme_manager.create_metric_card(
-            "Total Revenue",
-            f"${total_revenue:,.2f}",
-            f"↗️ {revenue_delta:.1f}% vs last period",
-            "positive" if revenue_delta > 0 else "negative"
-        )
-        st.markdown(revenue_card, unsafe_allow_html=True)
-    
-    with col2:
-        orders_delta = ((total_orders - prev_orders) / prev_orders * 100)
-        orders_card = theme_manager.create_metric_card(
-            "Total Orders",
-            f"{total_orders:,}",
-            f"↗️ {orders_delta:.1f}% vs last period",
-            "positive" if orders_delta > 0 else "negative"
-        )
-        st.markdown(orders_card, unsafe_allow_html=True)
-    
-    with col3:
-        aov_delta = ((avg_order_value - prev_aov) / prev_aov * 100)
-        aov_card = theme_manager.create_metric_card(
-            "Avg Order Value",
-            f"${avg_order_value:.2f}",
-            f"↗️ {aov_delta:.1f}% vs last period",
-            "positive" if aov_delta > 0 else "negative"
-        )
-        st.markdown(aov_card, unsafe_allow_html=True)
-    
-    with col4:
-        profit_delta = ((total_profit - prev_profit) / prev_profit * 100)
-        profit_card = theme_manager.create_metric_card(
-            "Total Profit",
-            f"${total_profit:,.2f}",
-            f"↗️ {profit_delta:.1f}% vs last period",
-            "positive" if profit_delta > 0 else "negative"
-        )
-        st.markdown(profit_card, unsafe_allow_html=True)
+    revenue_delta = ((total_revenue - prev_revenue) / prev_revenue * 100)
+    orders_delta = ((total_orders - prev_orders) / prev_orders * 100)
+    aov_delta = ((avg_order_value - prev_aov) / prev_aov * 100)
+    profit_delta = ((total_profit - prev_profit) / prev_profit * 100)
+    
+    # One row of cards, sent to the browser as a single element
+    theme_manager.render_metrics([
+        ("Total Revenue", f"${total_revenue:,.2f}",
+         f"↗️ {revenue_delta:.1f}% vs last period", "positive" if revenue_delta > 0 else "negative"),
+        ("Total Orders", f"{total_orders:,}",
+         f"↗️ {orders_delta:.1f}% vs last period", "positive" if orders_delta > 0 else "negative"),
+        ("Avg Order Value", f"${avg_order_value:.2f}",
+         f"↗️ {aov_delta:.1f}% vs last period", "positive" if aov_delta > 0 else "negative"),
+        ("Total Profit", f"${total_profit:,.2f}",
+         f"↗️ {profit_delta:.1f}% vs last period", "positive" if profit_delta > 0 else "negative"),
+    ])
 
 def render_sales_trend_chart(time_series: pd.DataFrame):
     """Render sales trend over time"""
@@ -13,14 +13,15 @@ import sys
 from pathlib import Path
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from utils.theme_manager import ThemeManager
+from utils.theme_manager import ThemeManager, get_theme_manager
 
 def render_page(sample_data: dict, uploaded_data: pd.DataFrame = None):
     """Render the data explorer page"""
-    theme_manager = ThemeManager()
+    theme_manager = get_theme_manager()
     
     st.title("🔍 Interactive Data Explorer")
     st.markdown("Dive deep into your data with advanced filtering and visualization tools")
@@ -171,7 +172,7 @@ def render_data_filtering_section(data: pd.DataFrame) -> pd.DataFrame:
     
     # Reset filters button
     if st.button("🔄 Reset All Filters"):
-        st.experimental_rerun()
+        st.rerun()
     
     return filtered_data
 
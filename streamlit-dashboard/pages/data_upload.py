@@ -3,24 +3,34 @@ Data Upload Page
 Handles CSV/Excel file uploads with validation and preview
 """
 
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-from io import BytesIO
+from io import BytesIO, StringIO
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# pandas is imported inside the functions that use it so that loading this
+# page stays cheap until a file is actually uploaded
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from utils.config import AppConfig
-from utils.theme_manager import ThemeManager
+from utils.config import AppConfig, get_config
+from utils.theme_manager import ThemeManager, get_theme_manager
+
+# Rows formatted per write when exporting processed data
+CSV_CHUNK_ROWS = 50_000
 
 def render_page():
     """Render the data upload page"""
-    config = AppConfig()
-    theme_manager = ThemeManager()
+    config = get_config()
+    theme_manager = get_theme_manager()
     
     st.title("📤 Data Upload")
     st.markdown("Upload your CSV or Excel files to analyze your own data")
@@ -29,15 +39,20 @@ def render_page():
     render_file_upload_section(config, theme_manager)
     
     # Data preview section
-    if st.session_state.uploaded_data is not None:
+    df = st.session_state.uploaded_data
+    if df is not None:
+        # Column statistics are computed once per render and shared by the sections
+        profile = _upload_profile(df)
+        kinds = _cols_by_kind(df)
+        
         st.markdown("---")
-        render_data_preview_section()
+        render_data_preview_section(df, profile, kinds)
         
         st.markdown("---")
-        render_data_quality_section()
+        render_data_quality_section(df, profile, kinds)
         
         st.markdown("---")
-        render_data_transformation_section()
+        render_data_transformation_section(df, profile, kinds)
 
 def render_file_upload_section(config: AppConfig, theme_manager: ThemeManager):
     """Render file upload interface"""
@@ -136,10 +151,11 @@ def render_file_upload_section(config: AppConfig, theme_manager: ThemeManager):
                     df = load_file(uploaded_file, file_ext, encoding, skiprows, nrows, sheet_name)
                     
                     if df is not None and not df.empty:
+                        df = ensure_column_major(df)
                         st.session_state.uploaded_data = df
                         st.session_state.upload_filename = uploaded_file.name
                         st.success(f"✅ Successfully loaded {len(df)} rows and {len(df.columns)} columns!")
-                        st.experimental_rerun()
+                        st.rerun()
                     else:
                         st.error("❌ Failed to load data. Please check your file format.")
                         
@@ -149,13 +165,20 @@ def render_file_upload_section(config: AppConfig, theme_manager: ThemeManager):
 
 def load_file(uploaded_file, file_ext: str, encoding: str, skiprows: int, nrows: int, sheet_name: str = None) -> pd.DataFrame:
     """Load file based on format"""
+    import pandas as pd
+    
+    # getvalue() hands back the bytes Streamlit already holds, and a fresh
+    # BytesIO over them shares that buffer and always starts at offset 0,
+    # so pandas can seek freely without another read of the upload
+    buffer = BytesIO(uploaded_file.getvalue())
+    
     try:
         if file_ext == 'csv':
             # Handle nrows parameter
             nrows_param = nrows if nrows > 0 else None
             
             df = pd.read_csv(
-                uploaded_file,
+                buffer,
                 encoding=encoding,
                 skiprows=skiprows,
                 nrows=nrows_param
@@ -170,7 +193,7 @@ def load_file(uploaded_file, file_ext: str, encoding: str, skiprows: int, nrows:
             nrows_param = nrows if nrows > 0 else None
             
             df = pd.read_excel(
-                uploaded_file,
+                buffer,
                 sheet_name=sheet_param,
                 skiprows=skiprows,
                 nrows=nrows_param
@@ -182,11 +205,94 @@ def load_file(uploaded_file, file_ext: str, encoding: str, skiprows: int, nrows:
         st.error(f"Error loading file: {str(e)}")
         return None
 
-def render_data_preview_section():
+def ensure_column_major(df: pd.DataFrame) -> pd.DataFrame:
+    """Make every numeric column contiguous in memory
+    
+    Column reductions (describe, sum, isnull) read each column end to end, which
+    is strided and much slower when a 2D block is laid out row-major. A single
+    copy after load rearranges the blocks once; frames that are already
+    column-contiguous are returned untouched.
+    """
+    import pandas as pd
+    
+    numeric_positions = [i for i, dtype in enumerate(df.dtypes) if pd.api.types.is_numeric_dtype(dtype)]
+    if all(df.iloc[:, i].to_numpy().flags['C_CONTIGUOUS'] for i in numeric_positions):
+        return df
+    
+    # A deep copy rebuilds each block in C order, i.e. one contiguous run per column
+    return df.copy()
+
+def _column_profile(df: pd.DataFrame) -> pd.DataFrame:
+    """Null and distinct-value counts per column, computed in one scan
+    
+    Uses Polars when it is installed: both statistics come out of a single
+    multi-threaded engine call over an Arrow copy of the frame. Falls back to
+    pandas when Polars is missing or cannot convert the frame (mixed-type
+    object columns, duplicate column names).
+    """
+    import pandas as pd
+    
+    try:
+        import polars as pl
+    except ImportError:
+        pl = None
+    
+    if pl is not None:
+        try:
+            pdf = pl.from_pandas(df)
+        except (ValueError, TypeError):
+            # Arrow conversion errors (ArrowInvalid, ArrowTypeError) subclass these
+            pdf = None
+        
+        if pdf is not None:
+            stats = pdf.select(
+                pl.all().null_count().name.suffix("__null"),
+                pl.all().n_unique().name.suffix("__unique"),
+            ).row(0)
+            ncols = len(df.columns)
+            null_count = pd.Series(stats[:ncols], index=df.columns)
+            # Polars counts null as a distinct value, pandas' nunique() does not
+            unique_count = pd.Series(stats[ncols:], index=df.columns) - (null_count > 0)
+            return pd.DataFrame({'null_count': null_count, 'unique_count': unique_count})
+    
+    return pd.DataFrame({'null_count': df.isna().sum(), 'unique_count': df.nunique()})
+
+def _upload_profile(df: pd.DataFrame) -> pd.DataFrame:
+    """Column profile of the current upload, computed once per uploaded frame
+    
+    Uploads and transformations always store a new frame, so the profile is
+    kept alongside the frame it describes and recomputed when that changes.
+    """
+    cached = st.session_state.get('_upload_profile')
+    if cached is None or cached[0] is not df:
+        cached = (df, _column_profile(df))
+        st.session_state['_upload_profile'] = cached
+    return cached[1]
+
+def _cols_by_kind(df: pd.DataFrame) -> dict:
+    """Column names grouped by dtype kind, so sections skip re-inspecting dtypes
+    
+    Only reads dtypes, so it is cheap enough to call per render without caching.
+    'numeric' follows is_numeric_dtype and therefore includes bool columns;
+    'object' also covers the dedicated string dtype pandas 3 infers for text.
+    """
+    import pandas as pd
+    
+    kinds = {'numeric': [], 'object': [], 'datetime': []}
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_numeric_dtype(dtype):
+            kinds['numeric'].append(col)
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            kinds['object'].append(col)
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            kinds['datetime'].append(col)
+    return kinds
+
+def render_data_preview_section(df: pd.DataFrame, profile: pd.DataFrame, kinds: dict):
     """Render data preview and basic information"""
-    st.subheader("👀 Data Preview")
+    import pandas as pd
     
-    df = st.session_state.uploaded_data
+    st.subheader("👀 Data Preview")
     
     # Basic info
     col1, col2, col3, col4 = st.columns(4)
@@ -204,24 +310,27 @@ def render_data_preview_section():
     # Column information
     st.write("**Column Information:**")
     
+    object_cols = set(kinds['object'])
+    numeric_cols = set(kinds['numeric'])
     col_info = []
     for col in df.columns:
         info = {
             'Column': col,
             'Type': str(df[col].dtype),
             'Non-Null Count': df[col].count(),
-            'Null Count': df[col].isnull().sum(),
-            'Unique Values': df[col].nunique()
+            'Null Count': profile.at[col, 'null_count'],
+            'Unique Values': profile.at[col, 'unique_count']
         }
         
         # Add sample values for non-numeric columns
-        if df[col].dtype == 'object':
-            unique_vals = df[col].unique()[:3]
+        if col in object_cols:
+            # Only the leading rows are needed to show a few examples
+            unique_vals = df[col].dropna().head(50).unique()[:3]
             info['Sample Values'] = ', '.join([str(v) for v in unique_vals])
         else:
             info['Min'] = df[col].min()
             info['Max'] = df[col].max()
-            info['Mean'] = df[col].mean() if pd.api.types.is_numeric_dtype(df[col]) else None
+            info['Mean'] = df[col].mean() if col in numeric_cols else None
         
         col_info.append(info)
     
@@ -237,25 +346,35 @@ def render_data_preview_section():
         show_head = st.radio("Show", ["Head", "Tail", "Random Sample"])
     
     with col1:
-        if show_head == "Head":
-            st.dataframe(df.head(sample_size), use_container_width=True)
-        elif show_head == "Tail":
-            st.dataframe(df.tail(sample_size), use_container_width=True)
-        else:
-            st.dataframe(df.sample(min(sample_size, len(df))), use_container_width=True)
+        st.dataframe(preview_rows(df, show_head, sample_size), use_container_width=True)
 
-def render_data_quality_section():
+def preview_rows(df: pd.DataFrame, mode: str, n: int) -> pd.DataFrame:
+    """Slice the rows shown in the data sample table
+    
+    The slice is copied into a standalone frame so that serializing it for the
+    browser never touches (or keeps alive) the blocks of the full upload.
+    """
+    if mode == "Head":
+        rows = df.head(n)
+    elif mode == "Tail":
+        rows = df.tail(n)
+    else:
+        rows = df.sample(min(n, len(df)))
+    
+    return rows.copy()
+
+def render_data_quality_section(df: pd.DataFrame, profile: pd.DataFrame, kinds: dict):
     """Render data quality analysis"""
-    st.subheader("🔍 Data Quality Analysis")
+    import pandas as pd
     
-    df = st.session_state.uploaded_data
+    st.subheader("🔍 Data Quality Analysis")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.write("**Missing Values Analysis**")
         
-        missing_data = df.isnull().sum()
+        missing_data = profile['null_count']
         missing_pct = (missing_data / len(df)) * 100
         
         missing_df = pd.DataFrame({
@@ -274,25 +393,22 @@ def render_data_quality_section():
         st.write("**Data Type Issues**")
         
         issues = []
-        for col in df.columns:
-            col_data = df[col]
-            
-            # Check for mixed data types in object columns
-            if col_data.dtype == 'object':
-                # Try to identify potential numeric columns stored as strings
-                non_null_data = col_data.dropna()
-                if len(non_null_data) > 0:
-                    # Check if it looks like numbers
-                    numeric_count = 0
-                    for val in non_null_data.head(100):
-                        try:
-                            float(str(val).replace(',', ''))
-                            numeric_count += 1
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    if numeric_count / min(len(non_null_data), 100) > 0.8:
-                        issues.append(f"{col}: May be numeric data stored as text")
+        # Check for mixed data types in object columns
+        for col in kinds['object']:
+            # Try to identify potential numeric columns stored as strings
+            non_null_data = df[col].dropna()
+            if len(non_null_data) > 0:
+                # Check if it looks like numbers
+                numeric_count = 0
+                for val in non_null_data.head(100):
+                    try:
+                        float(str(val).replace(',', ''))
+                        numeric_count += 1
+                    except (ValueError, TypeError):
+                        pass
+                
+                if numeric_count / min(len(non_null_data), 100) > 0.8:
+                    issues.append(f"{col}: May be numeric data stored as text")
         
         if issues:
             for issue in issues:
@@ -300,17 +416,18 @@ def render_data_quality_section():
         else:
             st.success("✅ No obvious data type issues found!")
     
-    # Quick statistics for numeric columns
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    # Quick statistics for numeric columns (bool columns have no quantiles)
+    numeric_cols = df.select_dtypes(include='number').columns
     if len(numeric_cols) > 0:
         st.write("**Numeric Columns Statistics**")
         st.dataframe(df[numeric_cols].describe(), use_container_width=True)
 
-def render_data_transformation_section():
-    """Render data transformation options"""
-    st.subheader("🔧 Data Transformations")
+def render_data_transformation_section(df: pd.DataFrame, profile: pd.DataFrame, kinds: dict):
+    """Render data transformation options
     
-    df = st.session_state.uploaded_data.copy()
+    df is read-only here; apply_transformation copies before it modifies anything.
+    """
+    st.subheader("🔧 Data Transformations")
     
     col1, col2 = st.columns(2)
     
@@ -339,18 +456,18 @@ def render_data_transformation_section():
             
             if transformation_type != "None":
                 if st.button("Apply Transformation"):
-                    df_transformed = apply_transformation(df, selected_cols, transformation_type)
+                    df_transformed = apply_transformation(df, selected_cols, transformation_type, kinds)
                     if df_transformed is not None:
                         st.session_state.uploaded_data = df_transformed
                         st.success("✅ Transformation applied successfully!")
-                        st.experimental_rerun()
+                        st.rerun()
     
     with col2:
         st.write("**Export Options**")
         
         # Export processed data
         if st.button("📥 Download Processed Data"):
-            csv = df.to_csv(index=False)
+            csv = dataframe_to_csv(df)
             st.download_button(
                 label="Download CSV",
                 data=csv,
@@ -360,7 +477,7 @@ def render_data_transformation_section():
         
         # Generate data summary report
         if st.button("📊 Generate Data Report"):
-            report = generate_data_report(df)
+            report = generate_data_report(df, profile, kinds)
             st.download_button(
                 label="Download Report",
                 data=report,
@@ -368,33 +485,38 @@ def render_data_transformation_section():
                 mime="text/plain"
             )
 
-def apply_transformation(df: pd.DataFrame, columns: list, transformation_type: str) -> pd.DataFrame:
+def apply_transformation(df: pd.DataFrame, columns: list, transformation_type: str,
+                         kinds: dict = None) -> pd.DataFrame:
     """Apply selected transformation to dataframe"""
+    import pandas as pd
+    
     try:
+        object_cols = set((kinds or _cols_by_kind(df))['object'])
+        text_cols = [col for col in columns if col in object_cols]
         df_copy = df.copy()
         
         if transformation_type == "Convert to Numeric":
-            for col in columns:
-                df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce')
+            df_copy[columns] = df_copy[columns].apply(pd.to_numeric, errors='coerce')
         
         elif transformation_type == "Convert to DateTime":
-            for col in columns:
-                df_copy[col] = pd.to_datetime(df_copy[col], errors='coerce')
+            df_copy[columns] = df_copy[columns].apply(pd.to_datetime, errors='coerce')
         
         elif transformation_type == "Remove Duplicates":
             df_copy = df_copy.drop_duplicates(subset=columns)
         
         elif transformation_type == "Fill Missing Values":
-            for col in columns:
-                if df_copy[col].dtype in ['object']:
-                    df_copy[col] = df_copy[col].fillna('Unknown')
-                else:
-                    df_copy[col] = df_copy[col].fillna(df_copy[col].mean())
+            other_cols = [col for col in columns if col not in text_cols]
+            
+            if text_cols:
+                df_copy[text_cols] = df_copy[text_cols].fillna('Unknown')
+            if other_cols:
+                df_copy[other_cols] = df_copy[other_cols].fillna(df_copy[other_cols].mean())
         
         elif transformation_type == "Standardize Text":
-            for col in columns:
-                if df_copy[col].dtype == 'object':
-                    df_copy[col] = df_copy[col].astype(str).str.strip().str.title()
+            if text_cols:
+                df_copy[text_cols] = df_copy[text_cols].apply(
+                    lambda s: s.astype(str).str.strip().str.title()
+                )
         
         return df_copy
     
@@ -402,33 +524,60 @@ def apply_transformation(df: pd.DataFrame, columns: list, transformation_type: s
         st.error(f"Transformation failed: {str(e)}")
         return None
 
-def generate_data_report(df: pd.DataFrame) -> str:
-    """Generate a comprehensive data quality report"""
-    report = []
-    report.append("DATA QUALITY REPORT")
-    report.append("=" * 50)
-    report.append(f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
+def dataframe_to_csv(df: pd.DataFrame, chunk_rows: int = CSV_CHUNK_ROWS) -> bytes:
+    """Encode a dataframe as CSV bytes for download
+    
+    pandas writes the rows straight into the buffer ``chunk_rows`` at a time,
+    so peak memory stays at one chunk of formatted text on top of the output
+    instead of a full-size intermediate string.
+    """
+    buffer = BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8', chunksize=chunk_rows)
+    return buffer.getvalue()
+
+def generate_data_report(df: pd.DataFrame, profile: pd.DataFrame = None, kinds: dict = None) -> str:
+    """Generate a comprehensive data quality report
+    
+    profile and kinds are computed from df when the caller has not already.
+    """
+    import pandas as pd
+    
+    report = StringIO()
+    report.write(
+        "DATA QUALITY REPORT\n"
+        f"{'=' * 50}\n"
+        f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        "\n"
+    )
     
     # Basic info
-    report.append("BASIC INFORMATION:")
-    report.append(f"Total Rows: {len(df)}")
-    report.append(f"Total Columns: {len(df.columns)}")
-    report.append(f"Memory Usage: {df.memory_usage().sum() / 1024:.1f} KB")
-    report.append("")
-    
-    # Column details
-    report.append("COLUMN ANALYSIS:")
+    report.write(
+        "BASIC INFORMATION:\n"
+        f"Total Rows: {len(df)}\n"
+        f"Total Columns: {len(df.columns)}\n"
+        f"Memory Usage: {df.memory_usage().sum() / 1024:.1f} KB\n"
+        "\n"
+    )
+    
+    # Column details, one write per column block
+    report.write("COLUMN ANALYSIS:")
+    if profile is None:
+        profile = _column_profile(df)
+    numeric_cols = set((kinds or _cols_by_kind(df))['numeric'])
     for col in df.columns:
-        report.append(f"\n{col}:")
-        report.append(f"  Type: {df[col].dtype}")
-        report.append(f"  Non-null count: {df[col].count()}")
-        report.append(f"  Null count: {df[col].isnull().sum()}")
-        report.append(f"  Unique values: {df[col].nunique()}")
+        report.write(
+            f"\n\n{col}:"
+            f"\n  Type: {df[col].dtype}"
+            f"\n  Non-null count: {df[col].count()}"
+            f"\n  Null count: {profile.at[col, 'null_count']}"
+            f"\n  Unique values: {profile.at[col, 'unique_count']}"
+        )
         
-        if pd.api.types.is_numeric_dtype(df[col]):
-            report.append(f"  Min: {df[col].min()}")
-            report.append(f"  Max: {df[col].max()}")
-            report.append(f"  Mean: {df[col].mean():.2f}")
+        if col in numeric_cols:
+            report.write(
+                f"\n  Min: {df[col].min()}"
+                f"\n  Max: {df[col].max()}"
+                f"\n  Mean: {df[col].mean():.2f}"
+            )
     
-    return "\n".join(report)
\ No newline at end of file
+    return report.getvalue()
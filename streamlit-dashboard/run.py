@@ -6,7 +6,6 @@ Simplified entry point for the Streamlit dashboard
 
 import os
 import sys
-import subprocess
 from pathlib import Path
 
 def main():
@@ -42,25 +41,25 @@ def main():
     print("⏹️  Press Ctrl+C to stop the server")
     print("-" * 50)
     
-    # Launch Streamlit
+    # Launch Streamlit in this interpreter rather than spawning a second
+    # `python -m streamlit` process that would redo every import
     try:
-        cmd = [
-            sys.executable, "-m", "streamlit", "run", str(app_path),
-            "--server.headless", "false",
-            "--server.enableCORS", "false",
-            "--server.enableXsrfProtection", "false"
-        ]
+        from streamlit.web import bootstrap
         
-        subprocess.run(cmd, check=True)
+        flag_options = {
+            "server_headless": False,
+            "server_enableCORS": False,
+            "server_enableXsrfProtection": False
+        }
+        
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(app_path), False, [], flag_options)
+        return 0
         
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped by user")
         return 0
         
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error starting Streamlit: {e}")
-        return 1
-        
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return 1
@@ -4,18 +4,19 @@ Main entry point for the multi-page application
 """
 
 import streamlit as st
+import importlib
 import sys
 import os
 from pathlib import Path
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+project_root = str(Path(__file__).resolve().parents[1])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from utils.config import AppConfig
+from utils.config import get_config
 from utils.data_generator import DataGenerator
-from utils.theme_manager import ThemeManager
-from pages import dashboard, data_upload, data_explorer, settings, about
+from utils.theme_manager import get_theme_manager
 
 # Page configuration
 st.set_page_config(
@@ -30,24 +31,55 @@ st.set_page_config(
     }
 )
 
+# Sidebar navigation labels and the page each one routes to, built once at import
+_PAGES = (
+    ("📈 Dashboard", "Dashboard"),
+    ("📤 Data Upload", "Data Upload"),
+    ("🔍 Data Explorer", "Data Explorer"),
+    ("⚙️ Settings", "Settings"),
+    ("ℹ️ About", "About"),
+)
+_PAGE_LABELS = [label for label, _ in _PAGES]
+_PAGE_MAP = dict(_PAGES)
+
+@st.cache_data(ttl=3600, max_entries=4, show_spinner=False)
+def get_sample_data(size: int = 1000, seed: int = 42) -> dict:
+    """Sample datasets, generated once per (size, seed) and shared by every session"""
+    return DataGenerator(seed=seed).generate_sample_data(size)
+
 class StreamlitApp:
     """Main application class managing routing and session state"""
     
     def __init__(self):
-        self.config = AppConfig()
-        self.theme_manager = ThemeManager()
-        self.data_generator = DataGenerator()
+        self.config = get_config()
+        self.theme_manager = get_theme_manager()
+        # Pages are imported on first visit (sys.modules caches them after
+        # that); they pull in pandas/plotly, so only opened pages pay for it
+        self._routes = {
+            "Dashboard": lambda: importlib.import_module("pages.dashboard").render_page(
+                self._sample_data(), st.session_state.uploaded_data),
+            "Data Upload": lambda: importlib.import_module("pages.data_upload").render_page(),
+            "Data Explorer": lambda: importlib.import_module("pages.data_explorer").render_page(
+                self._sample_data(), st.session_state.uploaded_data),
+            "Settings": lambda: importlib.import_module("pages.settings").render_page(),
+            "About": lambda: importlib.import_module("pages.about").render_page(),
+        }
         self._initialize_session_state()
     
     def _initialize_session_state(self):
         """Initialize session state variables"""
         if 'initialized' not in st.session_state:
-            st.session_state.initialized = True
-            st.session_state.current_page = "Dashboard"
-            st.session_state.theme = "light"
-            st.session_state.uploaded_data = None
-            st.session_state.user_preferences = {}
-            st.session_state.sample_data = self.data_generator.generate_sample_data()
+            st.session_state.update({
+                'initialized': True,
+                'current_page': "Dashboard",
+                'theme': "light",
+                'uploaded_data': None,
+                'user_preferences': {}
+            })
+    
+    def _sample_data(self) -> dict:
+        """Sample datasets sized by the saved preference"""
+        return get_sample_data(st.session_state.user_preferences.get('sample_data_size', 1000))
     
     def render_sidebar(self):
         """Render the navigation sidebar"""
@@ -56,28 +88,20 @@ class StreamlitApp:
             st.markdown("---")
             
             # Navigation menu
-            pages = {
-                "📈 Dashboard": "Dashboard",
-                "📤 Data Upload": "Data Upload", 
-                "🔍 Data Explorer": "Data Explorer",
-                "⚙️ Settings": "Settings",
-                "ℹ️ About": "About"
-            }
-            
             selected_page = st.radio(
                 "Navigate to:",
-                list(pages.keys()),
+                _PAGE_LABELS,
                 key="page_selector"
             )
             
-            st.session_state.current_page = pages[selected_page]
+            st.session_state.current_page = _PAGE_MAP[selected_page]
             
             st.markdown("---")
             
             # Theme toggle
             if st.button("🌓 Toggle Theme"):
                 st.session_state.theme = "dark" if st.session_state.theme == "light" else "light"
-                st.experimental_rerun()
+                st.rerun()
             
             # Quick stats in sidebar
             st.markdown("### Quick Stats")
@@ -105,38 +129,38 @@ class StreamlitApp:
     def render_main_content(self):
         """Render the main page content based on current selection"""
         # Apply theme
-        self.theme_manager.apply_theme(st.session_state.theme)
+        self.theme_manager.apply_theme(
+            st.session_state.theme,
+            st.session_state.user_preferences.get('primary_color')
+        )
         
         # Route to appropriate page
-        if st.session_state.current_page == "Dashboard":
-            dashboard.render_page(st.session_state.sample_data, st.session_state.uploaded_data)
-        elif st.session_state.current_page == "Data Upload":
-            data_upload.render_page()
-        elif st.session_state.current_page == "Data Explorer":
-            data_explorer.render_page(st.session_state.sample_data, st.session_state.uploaded_data)
-        elif st.session_state.current_page == "Settings":
-            settings.render_page()
-        elif st.session_state.current_page == "About":
-            about.render_page()
+        self._routes[st.session_state.current_page]()
+    
+    def save_user_preferences(self):
+        """Persist preferences staged during this run with a single write"""
+        if not st.session_state.get('_prefs_dirty'):
+            return
+        
+        if self.config.save_user_settings(st.session_state.user_preferences):
+            st.session_state._prefs_dirty = False
+        else:
+            st.error("❌ Failed to save settings")
     
     def run(self):
         """Main application entry point"""
-        try:
-            self.render_sidebar()
-            self.render_main_content()
-            
-            # Footer
-            st.markdown("---")
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                st.markdown(
-                    "<p style='text-align: center; color: #666;'>Built with ❤️ using Streamlit</p>", 
-                    unsafe_allow_html=True
-                )
-                
-        except Exception as e:
-            st.error(f"Application error: {str(e)}")
-            st.exception(e)
+        self.render_sidebar()
+        self.render_main_content()
+        self.save_user_preferences()
+        
+        # Footer
+        st.markdown("---")
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.markdown(
+                "<p style='text-align: center; color: #666;'>Built with ❤️ using Streamlit</p>", 
+                unsafe_allow_html=True
+            )
 
 def main():
     """Application entry point"""
@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from utils.data_generator import DataGenerator
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Keep benchmarks off by default; opt in with --benchmark-enable
+
+    Without the flag, pytest-benchmark runs each benchmarked function once,
+    as a plain test. --benchmark-only also turns them on.
+    """
+    if config.pluginmanager.hasplugin("benchmark"):
+        if not (config.getoption("benchmark_enable") or config.getoption("benchmark_only")):
+            config.option.benchmark_disable = True
+
+@pytest.fixture(scope="session")
+def sample_data_100():
+    """100-row sample dataset, generated once per test session
+
+    Treat it as read-only; tests that modify data should copy it first.
+    """
+    return DataGenerator().generate_sample_data(100)
@@ -13,9 +13,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from utils.config import AppConfig
+from utils.config import AppConfig, get_config
 from utils.data_generator import DataGenerator
 from utils.theme_manager import ThemeManager
+from utils import serialization
+from pages.data_upload import apply_transformation, _column_profile
 
 class TestAppConfig:
     """Test application configuration"""
@@ -29,6 +31,14 @@ class TestAppConfig:
         assert len(config.SUPPORTED_FORMATS) > 0
         assert len(config.DEFAULT_COLOR_PALETTE) > 0
     
+    def test_shared_config(self):
+        """Test get_config returns one instance until its cache is cleared"""
+        config = get_config()
+        assert get_config() is config
+        
+        get_config.cache_clear()
+        assert get_config() is not config
+    
     def test_file_validation(self):
         """Test file upload validation"""
         config = AppConfig()
@@ -52,6 +62,15 @@ class TestAppConfig:
         assert is_valid == False
         assert "File too large" in message
     
+    def test_user_settings_round_trip(self, tmp_path):
+        """Test user settings survive a save and reload"""
+        config = AppConfig()
+        config.config_file = str(tmp_path / "config.json")
+        
+        settings = {'theme': 'dark', 'selected_metrics': ['Revenue'], 'decimal_places': 2}
+        assert config.save_user_settings(settings)
+        assert config.load_user_settings() == settings
+    
     def test_theme_colors(self):
         """Test theme color configuration"""
         config = AppConfig()
@@ -81,10 +100,9 @@ class TestDataGenerator:
         assert len(generator.regions) > 0
         assert len(generator.sales_channels) > 0
     
-    def test_sample_data_generation(self):
+    def test_sample_data_generation(self, sample_data_100):
         """Test sample data generation"""
-        generator = DataGenerator()
-        sample_data = generator.generate_sample_data(100)  # Small sample for testing
+        sample_data = sample_data_100
         
         # Check all datasets are generated
         assert 'sales_data' in sample_data
@@ -121,9 +139,10 @@ class TestDataGenerator:
         assert sales_data['total_amount'].dtype in ['float64', 'float32']
         
         # Check data ranges
-        assert sales_data['quantity'].min() >= 1
-        assert sales_data['total_amount'].min() > 0
-        assert sales_data['profit'].min() >= 0
+        stats = sales_data.agg({'quantity': 'min', 'total_amount': 'min', 'profit': 'min'})
+        assert stats['quantity'] >= 1
+        assert stats['total_amount'] > 0
+        assert stats['profit'] >= 0
     
     def test_customer_data_structure(self):
         """Test customer data structure"""
@@ -142,10 +161,13 @@ class TestDataGenerator:
             assert col in customer_data.columns
         
         # Check data validity
-        assert customer_data['age'].min() >= 18
-        assert customer_data['age'].max() <= 80
-        assert customer_data['total_spent'].min() > 0
-        assert customer_data['total_orders'].min() >= 1
+        stats = customer_data.agg({
+            'age': ['min', 'max'], 'total_spent': ['min'], 'total_orders': ['min']
+        })
+        assert stats.loc['min', 'age'] >= 18
+        assert stats.loc['max', 'age'] <= 80
+        assert stats.loc['min', 'total_spent'] > 0
+        assert stats.loc['min', 'total_orders'] >= 1
     
     def test_time_series_data(self):
         """Test time series data generation"""
@@ -165,8 +187,14 @@ class TestDataGenerator:
         assert time_series['sales'].dtype in ['float64', 'float32']
         
         # Check data validity
-        assert time_series['sales'].min() > 0  # Sales should be positive
-        assert time_series['profit_margin'].min() >= 0  # Profit margin should be non-negative
+        stats = time_series.agg({'sales': 'min', 'profit_margin': 'min'})
+        assert stats['sales'] > 0  # Sales should be positive
+        assert stats['profit_margin'] >= 0  # Profit margin should be non-negative
+        
+        # Rounded money columns hold exactly two decimals
+        for col in ['sales', 'cost', 'profit', 'avg_order_value']:
+            values = time_series[col].to_numpy(dtype='float64')
+            assert np.array_equal(values, values.round(2))
 
 class TestThemeManager:
     """Test theme management functionality"""
@@ -183,6 +211,23 @@ class TestThemeManager:
             assert 'background_color' in theme
             assert 'text_color' in theme
     
+    def test_compiled_theme(self):
+        """Test theme CSS is compiled once per theme/accent pair"""
+        theme_manager = ThemeManager()
+
+        css = theme_manager.compile_theme('dark')
+        assert theme_manager.themes['dark']['background_color'] in css
+        assert theme_manager.compile_theme('dark') is css
+
+        custom = theme_manager.compile_theme('dark', '#123456')
+        assert '#123456' in custom
+        assert custom != css
+
+        # Anything but a hex colour falls back to the palette accent
+        injected = 'red}</style><img src=x onerror=alert(1)>'
+        assert theme_manager.compile_theme('dark', injected) is css
+        assert theme_manager.resolve_accent('dark', injected) == theme_manager.themes['dark']['accent_color']
+
     def test_metric_card_creation(self):
         """Test metric card HTML generation"""
         theme_manager = ThemeManager()
@@ -196,6 +241,35 @@ class TestThemeManager:
         assert "↗️ +15%" in card_html
         assert "positive" in card_html
     
+    def test_component_text_escaped(self):
+        """Test labels and messages are HTML-escaped"""
+        theme_manager = ThemeManager()
+        
+        card_html = theme_manager.create_metric_card("<b>Users</b>", 1200)
+        assert "&lt;b&gt;Users&lt;/b&gt;" in card_html
+        assert "1200" in card_html
+        
+        alert_html = theme_manager.create_alert('Saved "report" & closed', "success")
+        assert "Saved &quot;report&quot; &amp; closed" in alert_html
+        
+        alert_html = theme_manager.create_alert("Hi", 'x" onmouseover="y')
+        assert 'onmouseover="' not in alert_html
+    
+    def test_render_metrics(self, monkeypatch):
+        """Test a row of metric cards is emitted as one markdown element"""
+        theme_manager = ThemeManager()
+        calls = []
+        monkeypatch.setattr("utils.theme_manager.st.markdown", lambda body, **kwargs: calls.append(body))
+        
+        theme_manager.render_metrics([
+            ("Revenue", "$10,000", "↗️ +15%", "positive"),
+            ("Orders", "250", None, "normal"),
+        ])
+        
+        assert len(calls) == 1
+        assert calls[0].startswith('<div class="metric-row">')
+        assert calls[0].count('class="metric-card"') == 2
+    
     def test_status_indicator_creation(self):
         """Test status indicator creation"""
         theme_manager = ThemeManager()
@@ -221,6 +295,31 @@ class TestThemeManager:
         
         # Check themes are different
         assert light_theme['background_color'] != dark_theme['background_color']
+        assert theme_manager.get_chart_theme('light') is light_theme
+        assert theme_manager.get_chart_theme('unknown') is light_theme
+
+class TestSerialization:
+    """Test JSON serialization helpers"""
+    
+    def test_round_trip(self):
+        """Test settings survive a dumps/loads round trip"""
+        settings = {'theme': 'dark', 'decimal_places': 2, 'selected_metrics': ['Revenue', 'Growth Rate']}
+        
+        data = serialization.dumps(settings)
+        assert isinstance(data, bytes)
+        assert serialization.loads(data) == settings
+        assert serialization.loads(data.decode('utf-8')) == settings
+    
+    def test_indented_output(self):
+        """Test indented output is human readable"""
+        data = serialization.dumps({'theme': 'light'}, indent=True)
+        assert data.decode('utf-8') == '{\n  "theme": "light"\n}'
+    
+    def test_invalid_json(self):
+        """Test malformed input raises a ValueError subclass"""
+        with pytest.raises(serialization.JSONDecodeError):
+            serialization.loads(b'{"theme": ')
+        assert issubclass(serialization.JSONDecodeError, ValueError)
 
 class TestDataProcessing:
     """Test data processing utilities"""
@@ -249,18 +348,44 @@ class TestDataProcessing:
         assert arr.mean() == 3.0
         assert arr.std() > 0
 
+class TestDataUpload:
+    """Test the data upload page helpers"""
+    
+    def test_column_profile_matches_pandas(self):
+        """Test the column profile agrees with pandas isna().sum() and nunique()"""
+        df = pd.DataFrame({
+            'int': [1, 2, 2, 3],
+            'float': [1.5, np.nan, 1.5, np.nan],
+            'text': ['a', None, 'b', 'a'],
+            'flag': [True, False, True, True],
+            'when': pd.to_datetime(['2024-01-01', None, '2024-01-02', '2024-01-01']),
+            'mixed': pd.Series([1, 'x', None, 2.5], dtype=object),
+        })
+        
+        # The whole frame does not convert to Arrow (mixed column) and falls back
+        # to pandas; the other columns go through the Polars path when installed
+        for frame in (df, df.drop(columns='mixed')):
+            profile = _column_profile(frame)
+            assert profile['null_count'].tolist() == frame.isna().sum().tolist()
+            assert profile['unique_count'].tolist() == frame.nunique().tolist()
+    
+    def test_remove_duplicates_mixed_types(self):
+        """Test values that only look alike are not treated as duplicates"""
+        df = pd.DataFrame({'key': pd.Series([1, '1', 2, 2.0], dtype=object), 'n': range(4)})
+        
+        result = apply_transformation(df, ['key'], "Remove Duplicates")
+        expected = df.drop_duplicates(subset=['key'])
+        pd.testing.assert_frame_equal(result, expected)
+        assert len(result) == 3
+
 # Integration test for basic functionality
 class TestIntegration:
     """Integration tests for combined functionality"""
     
-    def test_full_data_pipeline(self):
+    def test_full_data_pipeline(self, sample_data_100):
         """Test complete data generation and processing pipeline"""
-        # Generate data
-        generator = DataGenerator()
-        sample_data = generator.generate_sample_data(100)
-        
         # Process sales data
-        sales_data = sample_data['sales_data']
+        sales_data = sample_data_100['sales_data']
         
         # Test basic analytics operations
         total_revenue = sales_data['total_amount'].sum()
@@ -0,0 +1,37 @@
+"""
+Performance benchmarks for sample data generation
+
+Requires pytest-benchmark and is skipped without it. Benchmarks are
+disabled by default (see conftest.py), so a plain pytest run executes each
+function once. To measure:
+    pytest tests/test_perf.py --benchmark-enable
+To record a run:
+    pytest tests/test_perf.py --benchmark-only --benchmark-json=benchmark.json
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from utils.data_generator import DataGenerator
+
+@pytest.mark.benchmark(group="datagen")
+def test_sales_1k(benchmark):
+    """Benchmark 1,000 rows of sales data"""
+    generator = DataGenerator()
+    sales_data = benchmark(generator.generate_sales_data, 1000)
+    assert len(sales_data) == 1000
+
+@pytest.mark.benchmark(group="datagen")
+def test_time_series_3650(benchmark):
+    """Benchmark ten years of daily time series"""
+    generator = DataGenerator()
+    time_series = benchmark(generator.generate_time_series_data, 3650)
+    assert len(time_series) == 3651
+
+@pytest.mark.benchmark(group="datagen")
+def test_sample_data_10k(benchmark):
+    """Benchmark the full sample dataset"""
+    generator = DataGenerator()
+    sample_data = benchmark.pedantic(generator.generate_sample_data, args=(10000,), rounds=5)
+    assert len(sample_data['sales_data']) == 10000
@@ -5,8 +5,17 @@ Centralized settings and constants
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Any
-import json
+
+from utils import serialization
+
+@lru_cache(maxsize=1)
+def _config_dir() -> str:
+    """User config directory, created once per process"""
+    config_dir = os.path.expanduser("~/.streamlit_dashboard")
+    os.makedirs(config_dir, exist_ok=True)
+    return config_dir
 
 @dataclass
 class AppConfig:
@@ -55,19 +64,25 @@ class AppConfig:
         """Initialize configuration after object creation"""
         self.config_file = self._get_config_file_path()
         self.load_user_settings()
+        
+        # Upload validation lookups, derived once from the settings above
+        self._supported_formats = frozenset(self.SUPPORTED_FORMATS)
+        self._max_size_bytes = self.MAX_FILE_SIZE * 1024 * 1024
+        self._unsupported_format_message = (
+            f"Unsupported file format. Supported: {', '.join(self.SUPPORTED_FORMATS)}"
+        )
+        self._file_too_large_message = f"File too large. Max size: {self.MAX_FILE_SIZE}MB"
     
     def _get_config_file_path(self) -> str:
         """Get path to user configuration file"""
-        config_dir = os.path.expanduser("~/.streamlit_dashboard")
-        os.makedirs(config_dir, exist_ok=True)
-        return os.path.join(config_dir, "config.json")
+        return os.path.join(_config_dir(), "config.json")
     
     def load_user_settings(self) -> Dict[str, Any]:
         """Load user settings from file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    return serialization.loads(f.read())
         except Exception as e:
             print(f"Error loading config: {e}")
         return {}
@@ -75,8 +90,8 @@ class AppConfig:
     def save_user_settings(self, settings: Dict[str, Any]) -> bool:
         """Save user settings to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(serialization.dumps(settings, indent=True))
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -89,13 +104,17 @@ class AppConfig:
     def validate_file_upload(self, file_name: str, file_size: int) -> tuple[bool, str]:
         """Validate uploaded file"""
         # Check file extension
-        file_ext = os.path.splitext(file_name)[1].lower()
-        if file_ext not in self.SUPPORTED_FORMATS:
-            return False, f"Unsupported file format. Supported: {', '.join(self.SUPPORTED_FORMATS)}"
+        _, dot, ext = file_name.rpartition('.')
+        if (dot + ext).lower() not in self._supported_formats:
+            return False, self._unsupported_format_message
         
-        # Check file size (convert MB to bytes)
-        max_size_bytes = self.MAX_FILE_SIZE * 1024 * 1024
-        if file_size > max_size_bytes:
-            return False, f"File too large. Max size: {self.MAX_FILE_SIZE}MB"
+        # Check file size
+        if file_size > self._max_size_bytes:
+            return False, self._file_too_large_message
         
-        return True, "File validation passed"
\ No newline at end of file
+        return True, "File validation passed"
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """Shared application config; call get_config.cache_clear() to reload it"""
+    return AppConfig()
@@ -5,213 +5,322 @@ Creates realistic datasets for testing and demos
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import random
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+# Sample data configurations, shared by every generator: tuples back the
+# public properties, arrays are what the samplers draw from
+_PRODUCT_CATEGORIES = ('Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports')
+_CUSTOMER_SEGMENTS = ('Premium', 'Standard', 'Basic')
+_REGIONS = ('North America', 'Europe', 'Asia Pacific', 'Latin America', 'Africa')
+_SALES_CHANNELS = ('Online', 'Retail', 'Mobile', 'Partner')
+
+_PRODUCT_CATEGORIES_ARR = np.array(_PRODUCT_CATEGORIES)
+_CUSTOMER_SEGMENTS_ARR = np.array(_CUSTOMER_SEGMENTS)
+_REGIONS_ARR = np.array(_REGIONS)
+_SALES_CHANNELS_ARR = np.array(_SALES_CHANNELS)
+
+# Name pools for generated customers, converted to arrays once at import
+_FIRST_NAMES = np.array(['John', 'Jane', 'Michael', 'Sarah', 'David', 'Lisa', 'Robert', 'Emily'])
+_LAST_NAMES = np.array(['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis'])
+_GENDERS = np.array(['Male', 'Female', 'Other'])
+
+# Product name/subcategory pools per category. Rows of each grid line up with
+# _PRODUCT_CATEGORIES so a category index picks its pool by fancy indexing;
+# ragged subcategory lists are padded and sampled below their per-row length.
+_PRODUCT_TEMPLATES = {
+    'Electronics': ['Smartphone', 'Laptop', 'Tablet', 'Headphones', 'Camera', 'Speaker'],
+    'Clothing': ['T-Shirt', 'Jeans', 'Dress', 'Jacket', 'Shoes', 'Sweater'],
+    'Books': ['Novel', 'Textbook', 'Biography', 'Cookbook', 'Manual', 'Guide'],
+    'Home & Garden': ['Chair', 'Lamp', 'Plant', 'Tool Set', 'Pillow', 'Vase'],
+    'Sports': ['Basketball', 'Running Shoes', 'Yoga Mat', 'Dumbbells', 'Bicycle', 'Helmet']
+}
+_SUBCATEGORIES = {
+    'Electronics': ['Smartphones', 'Computers', 'Audio', 'Cameras', 'Accessories'],
+    'Clothing': ['Men\'s Wear', 'Women\'s Wear', 'Footwear', 'Accessories'],
+    'Books': ['Fiction', 'Non-Fiction', 'Educational', 'Reference'],
+    'Home & Garden': ['Furniture', 'Decor', 'Tools', 'Plants'],
+    'Sports': ['Fitness', 'Outdoor', 'Team Sports', 'Water Sports']
+}
+_TEMPLATE_GRID = np.array([_PRODUCT_TEMPLATES[c] for c in _PRODUCT_CATEGORIES])
+_SUBCATEGORY_COUNTS = np.array([len(_SUBCATEGORIES[c]) for c in _PRODUCT_CATEGORIES])
+_SUBCATEGORY_GRID = np.array([
+    _SUBCATEGORIES[c] + [''] * (_SUBCATEGORY_COUNTS.max() - len(_SUBCATEGORIES[c]))
+    for c in _PRODUCT_CATEGORIES
+])
+
+# Bounds for the unit_price, discount and profit_margin rows of a sales draw
+_SALES_PRICE_LOW = np.array([[10.0], [0.0], [0.1]])
+_SALES_PRICE_HIGH = np.array([[500.0], [0.3], [0.4]])
+
+# Noise scale per row of the standard-normal block fed to _time_series_columns:
+# sales, visitors, conversion rate, average order value, cost
+_TS_NOISE_SCALE = np.array([30.0, 50.0, 0.01, 10.0, 20.0], dtype=np.float32)
+
+_ADJECTIVES = np.array(['Premium', 'Professional', 'Ultra', 'Deluxe', 'Classic', 'Modern', 'Smart'])
+_COLORS = np.array(['Black', 'White', 'Blue', 'Red', 'Silver', 'Gold', 'Green'])
+_BRAND_PREFIXES = np.array(['Tech', 'Pro', 'Ultra', 'Premium', 'Elite', 'Smart', 'Neo', 'Alpha'])
+_BRAND_SUFFIXES = np.array(['Corp', 'Tech', 'Solutions', 'Systems', 'Works', 'Labs', 'Industries'])
+
+def _now() -> np.datetime64:
+    """Current local time as a datetime64[ns] scalar"""
+    return np.datetime64(datetime.now(), 'ns')
+
+def _ids(prefix: str, numbers: np.ndarray, width: int = 0) -> np.ndarray:
+    """Format integers as prefixed IDs zero-padded to width, e.g. TXN-000042"""
+    digits = numbers.astype(str)
+    if width:
+        digits = np.char.zfill(digits, width)
+    return np.char.add(prefix, digits)
+
+def _time_series_columns(n: int, noise: np.ndarray, visitor_rate: float,
+                         cost_rate: float) -> Dict[str, np.ndarray]:
+    """Compute every time-series metric column in one pass over preallocated buffers
+    
+    Trend, seasonality and noise are accumulated in place into the sales array
+    and the noise block is scaled in place, so the only allocations are the
+    output columns themselves. The arithmetic runs in float32: the columns are
+    plotted and summarised, never accumulated, so half the memory traffic is
+    free. Rounded money columns are returned as float64.
+    """
+    noise *= _TS_NOISE_SCALE[:, None]
+    
+    # Base level plus growth trend, then yearly and weekly seasonality
+    sales = np.linspace(1000, 1200, n, dtype=np.float32)
+    angle = np.arange(n, dtype=np.float32)
+    angle *= 2 * np.pi
+    wave = np.sin(angle / 365.25)
+    wave *= 100
+    sales += wave
+    np.divide(angle, 7, out=wave)
+    np.sin(wave, out=wave)
+    wave *= 50
+    sales += wave
+    sales += noise[0]
+    np.maximum(sales, 100, out=sales)  # Ensure positive values
+    
+    # avg_order_value reuses the wave buffer
+    np.multiply(sales, 0.1, out=wave)
+    np.maximum(wave, 1, out=wave)
+    np.divide(sales, wave, out=wave)
+    wave += noise[3]
+    
+    visitors = sales * visitor_rate
+    visitors += noise[1]
+    
+    conversion_rate = noise[2]
+    conversion_rate += 0.05
+    np.clip(conversion_rate, 0.01, 0.15, out=conversion_rate)
+    
+    cost = sales * cost_rate
+    cost += noise[4]
+    
+    # Money columns are widened before rounding; a float32 cannot hold 2-decimal
+    # values exactly, so rounding in float32 leaves e.g. 1004.260009765625
+    cost = cost.astype(np.float64).round(2)
+    sales = sales.astype(np.float64).round(2)
+    profit = (sales - cost).round(2)
+    
+    return {
+        'sales': sales,
+        'visitors': visitors.astype(int),
+        'conversion_rate': conversion_rate,
+        'avg_order_value': wave.astype(np.float64).round(2),
+        'cost': cost,
+        'profit': profit,
+        'profit_margin': (profit / sales).round(3)
+    }
 
 class DataGenerator:
     """Generate sample datasets for demonstration"""
     
-    def __init__(self):
-        """Initialize data generator with random seed for reproducibility"""
-        np.random.seed(42)
-        random.seed(42)
+    def __init__(self, seed: int = 42):
+        """Initialize data generator with random seed for reproducibility
         
-        # Sample data configurations
-        self.product_categories = ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports']
-        self.customer_segments = ['Premium', 'Standard', 'Basic']
-        self.regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Africa']
-        self.sales_channels = ['Online', 'Retail', 'Mobile', 'Partner']
+        Each instance owns its generators, so the global NumPy and random
+        module state is left alone.
+        """
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.pyrand = random.Random(seed)
+    
+    # Sample data configurations, shared by every instance
+    @property
+    def product_categories(self) -> Tuple[str, ...]:
+        return _PRODUCT_CATEGORIES
+    
+    @property
+    def customer_segments(self) -> Tuple[str, ...]:
+        return _CUSTOMER_SEGMENTS
+    
+    @property
+    def regions(self) -> Tuple[str, ...]:
+        return _REGIONS
+    
+    @property
+    def sales_channels(self) -> Tuple[str, ...]:
+        return _SALES_CHANNELS
     
     def generate_sample_data(self, rows: int = 1000) -> Dict[str, pd.DataFrame]:
-        """Generate comprehensive sample dataset"""
+        """Generate comprehensive sample dataset
+        
+        Not memoized here; the app caches the result with st.cache_data.
+        """
+        # One clock reading so all datasets agree on what "now" is
+        now = _now()
         return {
-            'sales_data': self.generate_sales_data(rows),
-            'customer_data': self.generate_customer_data(rows // 2),
-            'product_data': self.generate_product_data(100),
-            'time_series': self.generate_time_series_data(365)
+            'sales_data': self.generate_sales_data(rows, now),
+            'customer_data': self.generate_customer_data(rows // 2, now),
+            'product_data': self.generate_product_data(100, now),
+            'time_series': self.generate_time_series_data(365, now)
         }
     
-    def generate_sales_data(self, rows: int = 1000) -> pd.DataFrame:
+    def generate_sales_data(self, rows: int = 1000, now: Optional[np.datetime64] = None) -> pd.DataFrame:
         """Generate realistic sales transaction data"""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        
-        data = []
-        for i in range(rows):
-            # Generate random date within the last year
-            random_date = start_date + timedelta(
-                days=random.randint(0, (end_date - start_date).days)
-            )
-            
-            # Generate transaction
-            transaction = {
-                'transaction_id': f'TXN-{str(i+1).zfill(6)}',
-                'date': random_date,
-                'customer_id': f'CUST-{random.randint(1, 500):04d}',
-                'product_category': random.choice(self.product_categories),
-                'product_name': self._generate_product_name(),
-                'quantity': random.randint(1, 10),
-                'unit_price': round(random.uniform(10, 500), 2),
-                'discount': round(random.uniform(0, 0.3), 2),
-                'region': random.choice(self.regions),
-                'sales_channel': random.choice(self.sales_channels),
-                'customer_segment': random.choice(self.customer_segments)
-            }
-            
-            # Calculate derived fields
-            subtotal = transaction['quantity'] * transaction['unit_price']
-            transaction['total_amount'] = round(subtotal * (1 - transaction['discount']), 2)
-            transaction['profit_margin'] = round(random.uniform(0.1, 0.4), 2)
-            transaction['profit'] = round(transaction['total_amount'] * transaction['profit_margin'], 2)
-            
-            data.append(transaction)
-        
-        df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
-        return df.sort_values('date').reset_index(drop=True)
-    
-    def generate_customer_data(self, rows: int = 500) -> pd.DataFrame:
-        """Generate customer demographic and behavior data"""
-        data = []
-        for i in range(rows):
-            join_date = datetime.now() - timedelta(days=random.randint(30, 1095))  # 1 month to 3 years ago
-            
-            customer = {
-                'customer_id': f'CUST-{str(i+1).zfill(4)}',
-                'first_name': random.choice(['John', 'Jane', 'Michael', 'Sarah', 'David', 'Lisa', 'Robert', 'Emily']),
-                'last_name': random.choice(['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis']),
-                'email': f'customer{i+1}@email.com',
-                'age': random.randint(18, 80),
-                'gender': random.choice(['Male', 'Female', 'Other']),
-                'region': random.choice(self.regions),
-                'customer_segment': random.choice(self.customer_segments),
-                'join_date': join_date,
-                'total_orders': random.randint(1, 50),
-                'total_spent': round(random.uniform(100, 10000), 2),
-                'avg_order_value': round(random.uniform(50, 500), 2),
-                'last_purchase_date': join_date + timedelta(days=random.randint(0, 365)),
-                'preferred_channel': random.choice(self.sales_channels)
-            }
-            
-            # Calculate customer lifetime value
-            days_active = (datetime.now() - join_date).days
-            customer['customer_lifetime_value'] = round(
-                customer['total_spent'] * (days_active / 365) * random.uniform(1.2, 2.5), 2
-            )
-            
-            data.append(customer)
-        
-        df = pd.DataFrame(data)
-        df['join_date'] = pd.to_datetime(df['join_date'])
-        df['last_purchase_date'] = pd.to_datetime(df['last_purchase_date'])
-        return df
-    
-    def generate_product_data(self, rows: int = 100) -> pd.DataFrame:
-        """Generate product catalog data"""
-        data = []
-        for i in range(rows):
-            category = random.choice(self.product_categories)
-            
-            product = {
-                'product_id': f'PROD-{str(i+1).zfill(4)}',
-                'product_name': self._generate_product_name(category),
-                'category': category,
-                'subcategory': self._get_subcategory(category),
-                'brand': self._generate_brand_name(),
-                'cost_price': round(random.uniform(5, 200), 2),
-                'selling_price': round(random.uniform(10, 500), 2),
-                'stock_quantity': random.randint(0, 1000),
-                'reorder_level': random.randint(10, 100),
-                'supplier': f'Supplier-{random.randint(1, 20)}',
-                'rating': round(random.uniform(1, 5), 1),
-                'reviews_count': random.randint(0, 1000),
-                'is_active': random.choices([True, False], weights=[0.9, 0.1])[0],
-                'launch_date': datetime.now() - timedelta(days=random.randint(30, 1095))
-            }
-            
-            # Calculate profit margin
-            product['profit_margin'] = round(
-                (product['selling_price'] - product['cost_price']) / product['selling_price'], 2
-            )
-            
-            data.append(product)
-        
-        df = pd.DataFrame(data)
-        df['launch_date'] = pd.to_datetime(df['launch_date'])
-        return df
-    
-    def generate_time_series_data(self, days: int = 365) -> pd.DataFrame:
-        """Generate time series data for trend analysis"""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        end_date = _now() if now is None else now
+        start_date = end_date - np.timedelta64(365, 'D')
         
-        dates = pd.date_range(start=start_date, end=end_date, freq='D')
+        # Draw each column in one batch instead of row by row. Rows come out in
+        # date order: the offsets are sorted up front and transaction numbers
+        # follow that permutation, while every other column is an independent
+        # draw whose order is already random, so no frame-wide sort is needed.
+        day_offsets = self.rng.integers(0, 366, size=rows)
+        order = np.argsort(day_offsets, kind='stable')
+        dates = start_date + day_offsets[order].astype('timedelta64[D]')
         
-        # Generate base trends with seasonality
-        base_sales = 1000
-        trend = np.linspace(0, 200, len(dates))  # Growth trend
-        seasonal = 100 * np.sin(2 * np.pi * np.arange(len(dates)) / 365.25)  # Yearly seasonality
-        weekly = 50 * np.sin(2 * np.pi * np.arange(len(dates)) / 7)  # Weekly seasonality
-        noise = np.random.normal(0, 30, len(dates))  # Random noise
+        transaction_ids = _ids('TXN-', order + 1, 6)
+        customer_ids = _ids('CUST-', self.rng.integers(1, 501, size=rows), 4)
         
-        sales = base_sales + trend + seasonal + weekly + noise
-        sales = np.maximum(sales, 100)  # Ensure positive values
+        quantity = self.rng.integers(1, 11, size=rows)
         
-        # Generate related metrics
-        data = {
+        # unit_price, discount and profit_margin drawn and rounded as one block
+        price_terms = self.rng.uniform(_SALES_PRICE_LOW, _SALES_PRICE_HIGH, size=(3, rows))
+        np.round(price_terms, 2, out=price_terms)
+        unit_price, discount, profit_margin = price_terms
+        
+        # Calculate derived fields; each depends on the rounded value before it
+        subtotal = quantity * unit_price
+        total_amount = np.round(subtotal * (1 - discount), 2)
+        profit = np.round(total_amount * profit_margin, 2)
+        
+        return pd.DataFrame({
+            'transaction_id': transaction_ids,
             'date': dates,
-            'sales': sales.round(2),
-            'visitors': (sales * random.uniform(0.1, 0.3) + np.random.normal(0, 50, len(dates))).astype(int),
-            'conversion_rate': np.random.normal(0.05, 0.01, len(dates)).clip(0.01, 0.15),
-            'avg_order_value': (sales / np.maximum(sales * 0.1, 1) + np.random.normal(0, 10, len(dates))).round(2),
-            'cost': (sales * random.uniform(0.6, 0.8) + np.random.normal(0, 20, len(dates))).round(2)
-        }
+            'customer_id': customer_ids,
+            'product_category': self.rng.choice(_PRODUCT_CATEGORIES_ARR, size=rows),
+            'product_name': self._product_names(self.rng.integers(0, len(_PRODUCT_CATEGORIES_ARR), size=rows)),
+            'quantity': quantity,
+            'unit_price': unit_price,
+            'discount': discount,
+            'region': self.rng.choice(_REGIONS_ARR, size=rows),
+            'sales_channel': self.rng.choice(_SALES_CHANNELS_ARR, size=rows),
+            'customer_segment': self.rng.choice(_CUSTOMER_SEGMENTS_ARR, size=rows),
+            'total_amount': total_amount,
+            'profit_margin': profit_margin,
+            'profit': profit
+        })
+    
+    def generate_customer_data(self, rows: int = 500, now: Optional[np.datetime64] = None) -> pd.DataFrame:
+        """Generate customer demographic and behavior data"""
+        now = _now() if now is None else now
+        join_offsets = self.rng.integers(30, 1096, size=rows)  # 1 month to 3 years ago
+        join_dates = now - join_offsets.astype('timedelta64[D]')
+        purchase_offsets = self.rng.integers(0, 366, size=rows)
         
-        df = pd.DataFrame(data)
-        df['profit'] = df['sales'] - df['cost']
-        df['profit_margin'] = (df['profit'] / df['sales']).round(3)
+        customer_numbers = np.arange(1, rows + 1)
+        total_spent = np.round(self.rng.uniform(100, 10000, size=rows), 2)
         
-        return df
+        # Calculate customer lifetime value
+        days_active = join_offsets
+        customer_lifetime_value = np.round(
+            total_spent * (days_active / 365) * self.rng.uniform(1.2, 2.5, size=rows), 2
+        )
+        
+        return pd.DataFrame({
+            'customer_id': _ids('CUST-', customer_numbers, 4),
+            'first_name': self.rng.choice(_FIRST_NAMES, size=rows),
+            'last_name': self.rng.choice(_LAST_NAMES, size=rows),
+            'email': np.char.add(_ids('customer', customer_numbers), '@email.com'),
+            'age': self.rng.integers(18, 81, size=rows),
+            'gender': self.rng.choice(_GENDERS, size=rows),
+            'region': self.rng.choice(_REGIONS_ARR, size=rows),
+            'customer_segment': self.rng.choice(_CUSTOMER_SEGMENTS_ARR, size=rows),
+            'join_date': join_dates,
+            'total_orders': self.rng.integers(1, 51, size=rows),
+            'total_spent': total_spent,
+            'avg_order_value': np.round(self.rng.uniform(50, 500, size=rows), 2),
+            'last_purchase_date': join_dates + purchase_offsets.astype('timedelta64[D]'),
+            'preferred_channel': self.rng.choice(_SALES_CHANNELS_ARR, size=rows),
+            'customer_lifetime_value': customer_lifetime_value
+        })
     
-    def _generate_product_name(self, category: str = None) -> str:
-        """Generate realistic product names based on category"""
-        if not category:
-            category = random.choice(self.product_categories)
+    def generate_product_data(self, rows: int = 100, now: Optional[np.datetime64] = None) -> pd.DataFrame:
+        """Generate product catalog data"""
+        now = _now() if now is None else now
+        category_idx = self.rng.integers(0, len(_PRODUCT_CATEGORIES_ARR), size=rows)
         
-        product_templates = {
-            'Electronics': ['Smartphone', 'Laptop', 'Tablet', 'Headphones', 'Camera', 'Speaker'],
-            'Clothing': ['T-Shirt', 'Jeans', 'Dress', 'Jacket', 'Shoes', 'Sweater'],
-            'Books': ['Novel', 'Textbook', 'Biography', 'Cookbook', 'Manual', 'Guide'],
-            'Home & Garden': ['Chair', 'Lamp', 'Plant', 'Tool Set', 'Pillow', 'Vase'],
-            'Sports': ['Basketball', 'Running Shoes', 'Yoga Mat', 'Dumbbells', 'Bicycle', 'Helmet']
-        }
+        cost_price = np.round(self.rng.uniform(5, 200, size=rows), 2)
+        selling_price = np.round(self.rng.uniform(10, 500, size=rows), 2)
+        launch_offsets = self.rng.integers(30, 1096, size=rows)
+        
+        return pd.DataFrame({
+            'product_id': _ids('PROD-', np.arange(1, rows + 1), 4),
+            'product_name': self._product_names(category_idx),
+            'category': _PRODUCT_CATEGORIES_ARR[category_idx],
+            'subcategory': self._subcategories(category_idx),
+            'brand': self._brand_names(rows),
+            'cost_price': cost_price,
+            'selling_price': selling_price,
+            'stock_quantity': self.rng.integers(0, 1001, size=rows),
+            'reorder_level': self.rng.integers(10, 101, size=rows),
+            'supplier': _ids('Supplier-', self.rng.integers(1, 21, size=rows)),
+            'rating': np.round(self.rng.uniform(1, 5, size=rows), 1),
+            'reviews_count': self.rng.integers(0, 1001, size=rows),
+            'is_active': self.rng.random(size=rows) < 0.9,
+            'launch_date': now - launch_offsets.astype('timedelta64[D]'),
+            'profit_margin': np.round((selling_price - cost_price) / selling_price, 2)
+        })
+    
+    def generate_time_series_data(self, days: int = 365, now: Optional[np.datetime64] = None) -> pd.DataFrame:
+        """Generate time series data for trend analysis"""
+        end_date = _now() if now is None else now
+        start_date = end_date - np.timedelta64(days, 'D')
         
-        base_name = random.choice(product_templates.get(category, ['Product']))
-        adjectives = ['Premium', 'Professional', 'Ultra', 'Deluxe', 'Classic', 'Modern', 'Smart']
-        colors = ['Black', 'White', 'Blue', 'Red', 'Silver', 'Gold', 'Green']
+        # One entry per day, built directly rather than through date_range
+        dates = start_date + np.arange(days + 1).astype('timedelta64[D]')
         
-        name_parts = [random.choice(adjectives), base_name]
-        if random.random() > 0.5:
-            name_parts.append(random.choice(colors))
+        # Generate related metrics
+        data = {'date': dates}
+        data.update(_time_series_columns(
+            len(dates),
+            self.rng.standard_normal((len(_TS_NOISE_SCALE), len(dates)), dtype=np.float32),
+            self.pyrand.uniform(0.1, 0.3),
+            self.pyrand.uniform(0.6, 0.8)
+        ))
         
-        return ' '.join(name_parts)
+        # The column arrays are freshly allocated, so pandas can take them as-is
+        return pd.DataFrame(data, copy=False)
     
-    def _get_subcategory(self, category: str) -> str:
-        """Get subcategory based on main category"""
-        subcategories = {
-            'Electronics': ['Smartphones', 'Computers', 'Audio', 'Cameras', 'Accessories'],
-            'Clothing': ['Men\'s Wear', 'Women\'s Wear', 'Footwear', 'Accessories'],
-            'Books': ['Fiction', 'Non-Fiction', 'Educational', 'Reference'],
-            'Home & Garden': ['Furniture', 'Decor', 'Tools', 'Plants'],
-            'Sports': ['Fitness', 'Outdoor', 'Team Sports', 'Water Sports']
-        }
+    def _product_names(self, category_idx: np.ndarray) -> np.ndarray:
+        """Generate realistic product names for an array of category indices"""
+        rows = len(category_idx)
+        base_names = _TEMPLATE_GRID[category_idx, self.rng.integers(0, _TEMPLATE_GRID.shape[1], size=rows)]
+        adjectives = self.rng.choice(_ADJECTIVES, size=rows)
         
-        return random.choice(subcategories.get(category, ['General']))
+        names = np.char.add(np.char.add(adjectives, ' '), base_names)
+        with_color = self.rng.random(rows) > 0.5
+        colored = np.char.add(np.char.add(names, ' '), self.rng.choice(_COLORS, size=rows))
+        return np.where(with_color, colored, names)
     
-    def _generate_brand_name(self) -> str:
+    def _subcategories(self, category_idx: np.ndarray) -> np.ndarray:
+        """Pick a subcategory of each row's category"""
+        picks = self.rng.integers(0, _SUBCATEGORY_COUNTS[category_idx])
+        return _SUBCATEGORY_GRID[category_idx, picks]
+    
+    def _brand_names(self, rows: int) -> np.ndarray:
         """Generate realistic brand names"""
-        prefixes = ['Tech', 'Pro', 'Ultra', 'Premium', 'Elite', 'Smart', 'Neo', 'Alpha']
-        suffixes = ['Corp', 'Tech', 'Solutions', 'Systems', 'Works', 'Labs', 'Industries']
-        
-        return f"{random.choice(prefixes)}{random.choice(suffixes)}"
\ No newline at end of file
+        return np.char.add(
+            self.rng.choice(_BRAND_PREFIXES, size=rows),
+            self.rng.choice(_BRAND_SUFFIXES, size=rows)
+        )
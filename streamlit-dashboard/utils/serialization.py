@@ -0,0 +1,30 @@
+"""
+JSON serialization helpers
+Uses orjson when it is installed and falls back to the standard library
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json produces equivalent output
+    orjson = None
+
+# Raised by loads() on malformed input; both variants subclass ValueError
+JSONDecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or a string"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,261 +3,397 @@ Theme management for consistent UI styling
 Handles light/dark themes and custom CSS injection
 """
 
+import html
+import re
+import string
 import streamlit as st
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Tuple
+
+# Palette as CSS custom properties; the only part of the stylesheet that
+# varies by theme. Alpha variants are separate properties because a var()
+# cannot be suffixed with a hex alpha.
+_PALETTE_TEMPLATE = """<style>
+:root {{
+    --bg: {background_color};
+    --bg-secondary: {secondary_background_color};
+    --sidebar-bg: {sidebar_background};
+    --text: {text_color};
+    --accent: {accent_color};
+    --accent-20: {accent_color}20;
+    --accent-40: {accent_color}40;
+    --accent-cc: {accent_color}CC;
+}}
+</style>"""
+
+# Theme-independent rules, written against the custom properties above.
+# .streamlit/config.toml only sets the initial light palette, so the page,
+# sidebar and widget rules are what make the dark theme and custom accents
+# apply to the whole app. Streamlit's generated css-* class names change
+# between releases; elements are targeted by their st* class or data-testid.
+_STATIC_CSS = """/* Main container styling */
+.stApp, [data-testid="stHeader"] {
+    background-color: var(--bg);
+    color: var(--text);
+}
+
+/* Sidebar styling */
+[data-testid="stSidebar"] {
+    background-color: var(--sidebar-bg);
+}
+
+/* Metric cards styling */
+[data-testid="stMetric"] {
+    background-color: var(--bg-secondary);
+    border: 1px solid var(--accent-40);
+    border-radius: 10px;
+    padding: 1rem;
+}
+
+/* Custom metric card */
+.metric-card {
+    background-color: var(--bg-secondary);
+    padding: 1.5rem;
+    border-radius: 10px;
+    border: 1px solid var(--accent-40);
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    text-align: center;
+    margin: 0.5rem 0;
+}
+
+/* Row of metric cards rendered together */
+.metric-row {
+    display: flex;
+    gap: 1rem;
+}
+
+.metric-row > .metric-card {
+    flex: 1;
+}
+
+.metric-value {
+    font-size: 2rem;
+    font-weight: bold;
+    color: var(--accent);
+    margin: 0;
+}
+
+.metric-label {
+    font-size: 0.9rem;
+    color: var(--text);
+    opacity: 0.8;
+    margin: 0;
+}
+
+.metric-delta {
+    font-size: 0.8rem;
+    margin-top: 0.5rem;
+}
+
+.metric-delta.positive {
+    color: #00C851;
+}
+
+.metric-delta.negative {
+    color: #FF4444;
+}
+
+/* Headers */
+h1, h2, h3 {
+    color: var(--text);
+}
+
+/* Cards and containers */
+.stContainer > div {
+    background-color: var(--bg-secondary);
+    border-radius: 10px;
+    padding: 1rem;
+}
+
+/* Buttons */
+.stButton > button {
+    background-color: var(--accent);
+    color: white;
+    border: none;
+    border-radius: 5px;
+    transition: all 0.3s ease;
+}
+
+.stButton > button:hover {
+    background-color: var(--accent-cc);
+    transform: translateY(-2px);
+}
+
+/* Selectbox and inputs */
+.stSelectbox > div > div {
+    background-color: var(--bg-secondary);
+    color: var(--text);
+}
+
+.stTextInput > div > div > input {
+    background-color: var(--bg-secondary);
+    color: var(--text);
+}
+
+/* Plotly chart container */
+.js-plotly-plot {
+    background-color: var(--bg) !important;
+}
+
+/* Status indicators */
+.status-indicator {
+    display: inline-block;
+    width: 10px;
+    height: 10px;
+    border-radius: 50%;
+    margin-right: 8px;
+}
+
+.status-success {
+    background-color: #00C851;
+}
+
+.status-warning {
+    background-color: #FF8800;
+}
+
+.status-error {
+    background-color: #FF4444;
+}
+
+/* Data table styling */
+.dataframe {
+    background-color: var(--bg-secondary);
+    color: var(--text);
+}
+
+/* Sidebar navigation */
+.nav-item {
+    padding: 0.5rem 1rem;
+    margin: 0.25rem 0;
+    border-radius: 5px;
+    cursor: pointer;
+    transition: background-color 0.3s ease;
+}
+
+.nav-item:hover {
+    background-color: var(--accent-20);
+}
+
+.nav-item.active {
+    background-color: var(--accent);
+    color: white;
+}
+
+/* Loading spinner */
+.stSpinner {
+    color: var(--accent);
+}
+
+/* Alert messages */
+.alert {
+    padding: 1rem;
+    border-radius: 5px;
+    margin: 1rem 0;
+}
+
+.alert-success {
+    background-color: #00C85120;
+    border-left: 4px solid #00C851;
+    color: #00C851;
+}
+
+.alert-warning {
+    background-color: #FF880020;
+    border-left: 4px solid #FF8800;
+    color: #FF8800;
+}
+
+.alert-error {
+    background-color: #FF444420;
+    border-left: 4px solid #FF4444;
+    color: #FF4444;
+}
+
+.alert-info {
+    background-color: var(--accent-20);
+    border-left: 4px solid var(--accent);
+    color: var(--accent);
+}
+"""
+
+# HTML fragments for the component helpers
+_METRIC_TMPL = (
+    '<div class="metric-card">'
+    '<p class="metric-value">{value}</p>'
+    '<p class="metric-label">{title}</p>'
+    '{delta_html}'
+    '</div>'
+)
+_DELTA_TMPL = '<p class="{cls}">{delta}</p>'
+_STATUS_TMPL = '<span class="status-indicator status-{status}"></span>'
+_STATUS_PREFIX = {status: _STATUS_TMPL.format(status=status) for status in ('success', 'warning', 'error', 'info')}
+_ALERT_TMPL = '<div class="alert alert-{alert_type}">{message}</div>'
+
+def _minify_css(css: str) -> str:
+    """Strip comments and non-semantic whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css)
+    return re.sub(r'\s+', ' ', css).strip()
+
+def _split_template(tmpl: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split a format template into its literal chunks and the field names
+    between them; there is always one more chunk than there are fields"""
+    parts, keys = [], []
+    literal = ""
+    for text, key, _, _ in string.Formatter().parse(tmpl):
+        literal += text
+        if key is not None:
+            parts.append(literal)
+            keys.append(key)
+            literal = ""
+    parts.append(literal)
+    return tuple(parts), tuple(keys)
+
+# Minified once at import; these are the strings sent on every rerun
+_PALETTE_TEMPLATE_MIN = _minify_css(_PALETTE_TEMPLATE)
+_STATIC_STYLE = "<style>" + _minify_css(_STATIC_CSS) + "</style>"
+
+# Palette template pre-split so rendering is a single join
+_CSS_PARTS, _CSS_KEYS = _split_template(_PALETTE_TEMPLATE_MIN)
+
+@lru_cache(maxsize=8)
+def _render_css(palette: Tuple[Tuple[str, str], ...]) -> str:
+    """Render a palette's :root block once, shared by every ThemeManager"""
+    values = dict(palette)
+    out = [None] * (len(_CSS_PARTS) + len(_CSS_KEYS))
+    out[0::2] = _CSS_PARTS
+    out[1::2] = [values[key] for key in _CSS_KEYS]
+    return "".join(out)
+
+# Accent overrides come from user settings files and end up inside a
+# <style> block, so only plain hex colours are accepted
+_HEX_COLOR = re.compile(r'^#[0-9A-Fa-f]{3,8}$')
+
+@lru_cache(maxsize=512)
+def _esc(text: str) -> str:
+    """HTML-escape a label; dashboards repeat the same labels every rerun"""
+    return html.escape(text, quote=True)
+
+def _chart_theme(theme: Mapping[str, str]) -> Mapping[str, Any]:
+    """Chart styling for one palette"""
+    return MappingProxyType({
+        'background_color': theme['background_color'],
+        'text_color': theme['text_color'],
+        'grid_color': theme['text_color'] + '20',
+        'paper_bgcolor': theme['background_color'],
+        'plot_bgcolor': theme['background_color']
+    })
+
+# Built-in palettes; read-only so every ThemeManager can share them
+_THEMES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'light': MappingProxyType({
+        'primary_color': '#FF6B6B',
+        'background_color': '#FFFFFF',
+        'secondary_background_color': '#F0F2F6',
+        'text_color': '#262730',
+        'accent_color': '#FF4B4B',
+        'sidebar_background': '#F0F2F6'
+    }),
+    'dark': MappingProxyType({
+        'primary_color': '#FF6B6B',
+        'background_color': '#0E1117',
+        'secondary_background_color': '#262730',
+        'text_color': '#FAFAFA',
+        'accent_color': '#FF4B4B',
+        'sidebar_background': '#262730'
+    })
+})
+
+# Palette blocks and chart settings for the built-in themes
+_THEME_CSS = MappingProxyType({name: _render_css(tuple(palette.items())) for name, palette in _THEMES.items()})
+_CHART_THEMES = MappingProxyType({name: _chart_theme(palette) for name, palette in _THEMES.items()})
 
 class ThemeManager:
     """Manages application themes and styling"""
     
     def __init__(self):
         """Initialize theme manager"""
-        self.themes = {
-            'light': {
-                'primary_color': '#FF6B6B',
-                'background_color': '#FFFFFF',
-                'secondary_background_color': '#F0F2F6',
-                'text_color': '#262730',
-                'accent_color': '#FF4B4B',
-                'sidebar_background': '#F0F2F6'
-            },
-            'dark': {
-                'primary_color': '#FF6B6B',
-                'background_color': '#0E1117',
-                'secondary_background_color': '#262730',
-                'text_color': '#FAFAFA',
-                'accent_color': '#FF4B4B',
-                'sidebar_background': '#262730'
-            }
-        }
+        self.themes = _THEMES
+        self._css = _THEME_CSS
+        self._chart_themes = _CHART_THEMES
     
-    def apply_theme(self, theme_name: str = 'light'):
-        """Apply selected theme to the application"""
-        theme = self.themes.get(theme_name, self.themes['light'])
-        
-        # Custom CSS for theme styling
-        css = f"""
-        <style>
-        /* Main container styling */
-        .main {{
-            background-color: {theme['background_color']};
-            color: {theme['text_color']};
-        }}
-        
-        /* Sidebar styling */
-        .css-1d391kg {{
-            background-color: {theme['sidebar_background']};
-        }}
-        
-        /* Metric cards styling */
-        .css-1xarl3l {{
-            background-color: {theme['secondary_background_color']};
-            border: 1px solid {theme['accent_color']}40;
-            border-radius: 10px;
-            padding: 1rem;
-        }}
-        
-        /* Custom metric card */
-        .metric-card {{
-            background-color: {theme['secondary_background_color']};
-            padding: 1.5rem;
-            border-radius: 10px;
-            border: 1px solid {theme['accent_color']}40;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-            margin: 0.5rem 0;
-        }}
-        
-        .metric-value {{
-            font-size: 2rem;
-            font-weight: bold;
-            color: {theme['accent_color']};
-            margin: 0;
-        }}
-        
-        .metric-label {{
-            font-size: 0.9rem;
-            color: {theme['text_color']};
-            opacity: 0.8;
-            margin: 0;
-        }}
-        
-        .metric-delta {{
-            font-size: 0.8rem;
-            margin-top: 0.5rem;
-        }}
-        
-        .metric-delta.positive {{
-            color: #00C851;
-        }}
-        
-        .metric-delta.negative {{
-            color: #FF4444;
-        }}
-        
-        /* Headers */
-        h1, h2, h3 {{
-            color: {theme['text_color']};
-        }}
-        
-        /* Cards and containers */
-        .stContainer > div {{
-            background-color: {theme['secondary_background_color']};
-            border-radius: 10px;
-            padding: 1rem;
-        }}
-        
-        /* Buttons */
-        .stButton > button {{
-            background-color: {theme['accent_color']};
-            color: white;
-            border: none;
-            border-radius: 5px;
-            transition: all 0.3s ease;
-        }}
-        
-        .stButton > button:hover {{
-            background-color: {theme['accent_color']}CC;
-            transform: translateY(-2px);
-        }}
-        
-        /* Selectbox and inputs */
-        .stSelectbox > div > div {{
-            background-color: {theme['secondary_background_color']};
-            color: {theme['text_color']};
-        }}
-        
-        .stTextInput > div > div > input {{
-            background-color: {theme['secondary_background_color']};
-            color: {theme['text_color']};
-        }}
-        
-        /* Plotly chart container */
-        .js-plotly-plot {{
-            background-color: {theme['background_color']} !important;
-        }}
-        
-        /* Status indicators */
-        .status-indicator {{
-            display: inline-block;
-            width: 10px;
-            height: 10px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }}
+    def apply_theme(self, theme_name: str = 'light', accent_color: Optional[str] = None):
+        """Apply selected theme to the application
         
-        .status-success {{
-            background-color: #00C851;
-        }}
-        
-        .status-warning {{
-            background-color: #FF8800;
-        }}
-        
-        .status-error {{
-            background-color: #FF4444;
-        }}
-        
-        /* Data table styling */
-        .dataframe {{
-            background-color: {theme['secondary_background_color']};
-            color: {theme['text_color']};
-        }}
-        
-        /* Sidebar navigation */
-        .nav-item {{
-            padding: 0.5rem 1rem;
-            margin: 0.25rem 0;
-            border-radius: 5px;
-            cursor: pointer;
-            transition: background-color 0.3s ease;
-        }}
-        
-        .nav-item:hover {{
-            background-color: {theme['accent_color']}20;
-        }}
-        
-        .nav-item.active {{
-            background-color: {theme['accent_color']};
-            color: white;
-        }}
-        
-        /* Loading spinner */
-        .stSpinner {{
-            color: {theme['accent_color']};
-        }}
-        
-        /* Alert messages */
-        .alert {{
-            padding: 1rem;
-            border-radius: 5px;
-            margin: 1rem 0;
-        }}
-        
-        .alert-success {{
-            background-color: #00C85120;
-            border-left: 4px solid #00C851;
-            color: #00C851;
-        }}
-        
-        .alert-warning {{
-            background-color: #FF880020;
-            border-left: 4px solid #FF8800;
-            color: #FF8800;
-        }}
-        
-        .alert-error {{
-            background-color: #FF444420;
-            border-left: 4px solid #FF4444;
-            color: #FF4444;
-        }}
+        The static rules and the palette go out as two separate elements, so a
+        theme switch only replaces the small :root block while the stylesheet
+        element stays identical. Both are emitted on every rerun because
+        Streamlit removes any element a run does not re-render.
+        """
+        self._inject_static_css()
+        self._inject_palette(theme_name, accent_color)
+    
+    def _inject_static_css(self):
+        """Emit the theme-independent rules"""
+        st.markdown(_STATIC_STYLE, unsafe_allow_html=True)
+    
+    def _inject_palette(self, theme_name: str, accent_color: Optional[str] = None):
+        """Emit the :root colour block for the theme"""
+        st.markdown(self.compile_theme(theme_name, accent_color), unsafe_allow_html=True)
+    
+    def resolve_accent(self, theme_name: str = 'light', accent_color: Optional[str] = None) -> str:
+        """Accent colour to use: the override if it is a hex colour, else the palette's"""
+        if isinstance(accent_color, str) and _HEX_COLOR.match(accent_color):
+            return accent_color
+        return self.themes.get(theme_name, self.themes['light'])['accent_color']
+    
+    def compile_theme(self, theme_name: str = 'light', accent_color: Optional[str] = None) -> str:
+        """Palette CSS block for a theme, optionally with its accent colour overridden
         
-        .alert-info {{
-            background-color: {theme['accent_color']}20;
-            border-left: 4px solid {theme['accent_color']};
-            color: {theme['accent_color']};
-        }}
-        </style>
+        Overrides that are not hex colours are ignored.
         """
+        if not (isinstance(accent_color, str) and _HEX_COLOR.match(accent_color)):
+            return self._css.get(theme_name, self._css['light'])
         
-        st.markdown(css, unsafe_allow_html=True)
+        theme = {**self.themes.get(theme_name, self.themes['light']), 'accent_color': accent_color}
+        return _render_css(tuple(theme.items()))
     
     def create_metric_card(self, title: str, value: str, delta: str = None, delta_color: str = "normal"):
         """Create a styled metric card"""
-        delta_class = ""
-        if delta and delta_color != "normal":
-            delta_class = f"metric-delta {delta_color}"
+        delta_html = _DELTA_TMPL.format(
+            cls="metric-delta" if delta_color == "normal" else f"metric-delta {delta_color}",
+            delta=_esc(str(delta))
+        ) if delta else ""
         
-        delta_html = ""
-        if delta:
-            delta_html = f'<p class="{delta_class}">{delta}</p>'
+        return _METRIC_TMPL.format(value=_esc(str(value)), title=_esc(str(title)), delta_html=delta_html)
+    
+    def render_metrics(self, metrics: List[Tuple[str, str, Optional[str], str]]):
+        """Render a row of metric cards with a single st.markdown call
         
-        card_html = f"""
-        <div class="metric-card">
-            <p class="metric-value">{value}</p>
-            <p class="metric-label">{title}</p>
-            {delta_html}
-        </div>
+        Each entry is (title, value, delta, delta_color) as for create_metric_card.
         """
-        
-        return card_html
+        parts = [self.create_metric_card(*metric) for metric in metrics]
+        st.markdown('<div class="metric-row">' + "".join(parts) + '</div>', unsafe_allow_html=True)
     
     def create_status_indicator(self, status: str, text: str = ""):
         """Create a status indicator with optional text"""
-        status_class = f"status-{status}"
-        return f'<span class="status-indicator {status_class}"></span>{text}'
+        prefix = _STATUS_PREFIX.get(status) or _STATUS_TMPL.format(status=_esc(str(status)))
+        return prefix + _esc(str(text))
     
     def create_alert(self, message: str, alert_type: str = "info"):
         """Create a styled alert message"""
-        return f'<div class="alert alert-{alert_type}">{message}</div>'
+        return _ALERT_TMPL.format(alert_type=_esc(str(alert_type)), message=_esc(str(message)))
     
-    def get_chart_theme(self, theme_name: str = 'light') -> Dict[str, Any]:
-        """Get chart styling configuration for the current theme"""
-        theme = self.themes.get(theme_name, self.themes['light'])
+    def get_chart_theme(self, theme_name: str = 'light') -> Mapping[str, Any]:
+        """Get chart styling configuration for the current theme
         
-        return {
-            'background_color': theme['background_color'],
-            'text_color': theme['text_color'],
-            'grid_color': theme['text_color'] + '20',
-            'paper_bgcolor': theme['background_color'],
-            'plot_bgcolor': theme['background_color']
-        }
\ No newline at end of file
+        The mapping is shared and read-only; copy it with dict() to modify.
+        """
+        return self._chart_themes.get(theme_name, self._chart_themes['light'])
+
+@st.cache_resource
+def get_theme_manager() -> ThemeManager:
+    """Theme manager shared across reruns and sessions"""
+    return ThemeManager()